@@ -38,4 +38,5 @@ if __name__ == "__main__":
     for unpacked in read_log(INPUT_PATH):
         logger.put(process_input(unpacked))
     logger.write()
+    logger.close()
     print(f'Extended log written to "{OUTPUT_PATH}"')
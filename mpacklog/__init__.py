@@ -11,7 +11,7 @@ __version__ = "4.0.0"
 
 from .async_logger import AsyncLogger
 from .log_server import LogServer
-from .read_log import read_log
+from .read_log import read_log, read_logs
 from .sync_logger import SyncLogger
 
 __all__ = [
@@ -19,4 +19,5 @@ __all__ = [
     "LogServer",
     "SyncLogger",
     "read_log",
+    "read_logs",
 ]
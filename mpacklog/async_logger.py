@@ -7,26 +7,58 @@
 """Logger with Asynchronous I/O."""
 
 import asyncio
+from typing import Iterable, Optional
 
 import aiofiles
 import msgpack
 
-from .serialize import serialize
+from .serialize import serialize, serialize_ext
+from .utils import drop_page_cache
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
 
 
 class AsyncLogger:
     """Logger with Asynchronous I/O."""
 
-    def __init__(self, path):
+    def __init__(
+        self,
+        path,
+        schema: Optional[type] = None,
+        numpy_ext: bool = False,
+    ):
         """Initialize logger.
 
         Args:
             path: Path to the output log file.
+            schema: Optional ``msgspec.Struct`` subclass of logged messages.
+                When messages have a fixed schema, putting instances of this
+                class rather than dictionaries is faster to encode, as field
+                names are encoded once and for all. Structs are written as
+                MessagePack maps, so that the log file format is unchanged.
+            numpy_ext: If set, NumPy arrays in dictionary messages are packed
+                as raw bytes in MessagePack extension types, rather than as
+                lists of numbers. See :func:`mpacklog.serialize.serialize_ext`.
+                This option cannot be combined with a schema.
+
+        Raises:
+            ImportError: If a schema is provided but msgspec is not installed.
+            ValueError: If both a schema and ``numpy_ext`` are provided.
         """
+        if schema is not None and msgspec is None:
+            raise ImportError("msgspec is required to log with a schema")
+        if schema is not None and numpy_ext:
+            raise ValueError("numpy_ext is not supported with a schema")
+        self.__first_write = asyncio.Event()
         self.__writing = False
         self.__keep_going = True
+        self.__serialize = serialize_ext if numpy_ext else serialize
         self.path = path
-        self.queue = asyncio.Queue()
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.schema = schema
 
     async def put(self, message):
         """Put a new message in the logging queue.
@@ -36,6 +68,19 @@ class AsyncLogger:
         """
         await self.queue.put(message)
 
+    async def put_many(self, messages: Iterable) -> None:
+        """Put several messages in the logging queue at once.
+
+        Args:
+            messages: New messages, in the order they should be logged.
+        """
+        for message in messages:
+            self.queue.put_nowait(message)  # the queue is unbounded
+
+    async def wait_first_write(self) -> None:
+        """Wait until a first message has been written to the log file."""
+        await self.__first_write.wait()
+
     async def stop(self):
         """Break the loop of the `write` coroutine."""
         self.__keep_going = False
@@ -48,14 +93,23 @@ class AsyncLogger:
         assert not self.__writing
         self.__writing = True
         async with aiofiles.open(self.path, "wb") as file:
-            packer = msgpack.Packer(default=serialize, use_bin_type=True)
+            if self.schema is not None:
+                encode = msgspec.msgpack.Encoder(enc_hook=serialize).encode
+            else:  # messages are dictionaries
+                packer = msgpack.Packer(
+                    default=self.__serialize, use_bin_type=True
+                )
+                encode = packer.pack
+            written, dropped = 0, 0
             keep_going = not self.queue.empty() if flush else self.__keep_going
             while keep_going:
                 message = await self.queue.get()
                 if message == {"exit": True}:
                     break
-                await file.write(packer.pack(message))
+                written += await file.write(encode(message))
                 await file.flush()
+                self.__first_write.set()
+                dropped = drop_page_cache(file.fileno(), written, dropped)
                 keep_going = (
                     not self.queue.empty() if flush else self.__keep_going
                 )
@@ -38,6 +38,8 @@ class CSVPrinter(Printer):
         def str_from_value(value):
             if isinstance(value, bool):
                 return "1" if value else "0"
+            if hasattr(value, "tolist"):  # numpy.ndarray
+                value = value.tolist()
             return str(value)
 
         values = [
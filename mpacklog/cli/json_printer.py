@@ -13,6 +13,23 @@ from .fields import filter_fields
 from .printer import Printer
 
 
+def _list_from_array(obj) -> list:
+    """Convert NumPy arrays, which the JSON encoder does not handle, to lists.
+
+    Args:
+        obj: Object the JSON encoder could not serialize.
+
+    Returns:
+        List of the values of the array.
+
+    Raises:
+        TypeError: If the object is not an array.
+    """
+    if hasattr(obj, "tolist"):  # numpy.ndarray
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
 class JSONPrinter(Printer):
     """Default printer: print everything in JSON Lines."""
 
@@ -32,6 +49,8 @@ class JSONPrinter(Printer):
             unpacked: Unpacked dictionary.
         """
         output_with_nan = json.dumps(
-            filter_fields(unpacked, self.fields), allow_nan=True
+            filter_fields(unpacked, self.fields),
+            allow_nan=True,
+            default=_list_from_array,
         )
         print(output_with_nan.replace(" NaN", " null"))  # kroOOOOoooonn!!!
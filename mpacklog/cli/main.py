@@ -13,6 +13,7 @@ import time
 import msgpack
 
 from mpacklog.log_server import LogServer
+from mpacklog.serialize import ext_hook
 
 from .csv_printer import CSVPrinter
 from .field_printer import FieldPrinter
@@ -96,16 +97,17 @@ def dump_log(logfile: str, printer: Printer, follow: bool = False) -> None:
         printer: Printer class to process unpacked messages.
         follow (optional): Keep file open and wait for updates?
     """
+    buffer = memoryview(bytearray(4096))  # reused across reads
     with open(logfile, "rb") as filehandle:
-        unpacker = msgpack.Unpacker(raw=False)
+        unpacker = msgpack.Unpacker(raw=False, ext_hook=ext_hook)
         while True:
-            data = filehandle.read(4096)
-            if not data:  # end of file
+            size = filehandle.readinto(buffer)
+            if not size:  # end of file
                 if follow:
                     time.sleep(0.001)
                     continue
                 break
-            unpacker.feed(data)
+            unpacker.feed(buffer[:size])
             try:
                 for unpacked in unpacker:
                     printer.process(unpacked)
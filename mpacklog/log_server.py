@@ -14,7 +14,7 @@ import aiofiles
 import msgpack
 from loop_rate_limiters import AsyncRateLimiter
 
-from mpacklog.serialize import serialize
+from mpacklog.serialize import ext_hook, serialize
 from mpacklog.utils import find_log_file
 
 
@@ -59,7 +59,7 @@ class LogServer:
         sock.connect(("localhost", self.port))
         sock.setblocking(False)
         self.__keep_going = False  # stop accepting new sockets
-        await loop.sock_sendall(sock, "stop".encode("utf-8"))
+        await loop.sock_sendall(sock, b"stop")
         while self.__stopped < 2:
             await asyncio.sleep(0.01)
         sock.close()
@@ -70,7 +70,7 @@ class LogServer:
         rate = AsyncRateLimiter(frequency=2000.0, name="unpack", warn=False)
         async with aiofiles.open(log_file, "rb") as file:
             await file.seek(0, 2)  # 0 is the offset, 2 means seek from the end
-            unpacker = msgpack.Unpacker(raw=False)
+            unpacker = msgpack.Unpacker(raw=False, ext_hook=ext_hook)
             while self.__keep_going:
                 data = await file.read(4096)
                 if not data:  # end of file
@@ -96,6 +96,7 @@ class LogServer:
         loop = asyncio.get_event_loop()
         request: str = "start"
         packer = msgpack.Packer(default=serialize, use_bin_type=True)
+        packed_log, reply = None, b""
         logging.info("New connection from %s", address)
         rate = AsyncRateLimiter(frequency=2000.0, name="serve", warn=False)
         try:
@@ -109,7 +110,9 @@ class LogServer:
                     logging.warning(str(exn))
                     continue
                 if request == "get":
-                    reply = packer.pack(self.last_log)
+                    if self.last_log is not packed_log:  # new log to pack
+                        packed_log = self.last_log
+                        reply = packer.pack(packed_log)
                     await loop.sock_sendall(client, reply)
                 elif request == "stop":
                     self.__keep_going = False
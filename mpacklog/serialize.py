@@ -6,6 +6,51 @@
 
 """Serialization function."""
 
+import struct
+from typing import Any, Callable, Dict
+
+import msgpack
+
+# MessagePack extension type code for NumPy arrays packed as raw bytes.
+NUMPY_EXT_CODE: int = 17
+
+
+def _serialize_tolist(obj):
+    return obj.tolist()
+
+
+def _serialize_np(obj):
+    return obj.np.tolist()
+
+
+def _serialize_method(obj):
+    return obj.serialize()
+
+
+def _serialize_identity(obj):
+    return obj
+
+
+_SERIALIZERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _find_serializer(obj) -> Callable[[Any], Any]:
+    """Find the serialization function for a given object.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        Function serializing objects of the same type as `obj`.
+    """
+    if hasattr(obj, "tolist"):  # numpy.ndarray, numpy scalars
+        return _serialize_tolist
+    if hasattr(obj, "np"):  # pinocchio.SE3
+        return _serialize_np
+    if hasattr(obj, "serialize"):  # more complex objects
+        return _serialize_method
+    return _serialize_identity
+
 
 def serialize(obj):
     r"""Serialize an object for message packing.
@@ -16,6 +61,11 @@ def serialize(obj):
     Returns:
         Serialized object.
 
+    Note:
+        The serialization function is looked up once per object type, then
+        cached, so that attributes are only probed on the first object of
+        each type.
+
     Note:
         Calling the numpy conversion is much faster than the default list
         constructor:
@@ -30,10 +80,81 @@ def serialize(obj):
         In [3]: %timeit x.tolist()
         117 ns ± 0.865 ns per loop (mean ± std. dev. of 7 runs, 1e7 loops each)
     """
-    if hasattr(obj, "tolist"):  # numpy.ndarray
-        return obj.tolist()
-    if hasattr(obj, "np"):  # pinocchio.SE3
-        return obj.np.tolist()
-    if hasattr(obj, "serialize"):  # more complex objects
-        return obj.serialize()
-    return obj
+    serializer = _SERIALIZERS.get(type(obj))
+    if serializer is None:
+        serializer = _find_serializer(obj)
+        _SERIALIZERS[type(obj)] = serializer
+    return serializer(obj)
+
+
+def _serialize_array_ext(obj):
+    dtype = obj.dtype
+    if obj.ndim < 1 or dtype.hasobject or dtype.fields is not None:
+        return serialize(obj)  # scalars, object and structured arrays
+    dtype_str = dtype.str.encode("ascii")  # e.g. b"<f8"
+    header = struct.pack(
+        f"<B{len(dtype_str)}sB{obj.ndim}I",
+        len(dtype_str),
+        dtype_str,
+        obj.ndim,
+        *obj.shape,
+    )
+    return msgpack.ExtType(NUMPY_EXT_CODE, header + obj.tobytes())
+
+
+_EXT_SERIALIZERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def serialize_ext(obj):
+    """Serialize an object, packing NumPy arrays as extension types.
+
+    Arrays are packed as a MessagePack extension type with code
+    :data:`NUMPY_EXT_CODE`, whose payload is a small header with the array
+    dtype and shape followed by the raw bytes of the array, rather than as a
+    list of numbers. Other objects, as well as arrays with object or
+    structured dtypes, are serialized by :func:`serialize`.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        Serialized object.
+
+    Note:
+        Extension types are decoded by :func:`ext_hook`. Readers of the log
+        that do not know about them will see opaque binary data, which is why
+        this serialization is opt-in.
+    """
+    serializer = _EXT_SERIALIZERS.get(type(obj))
+    if serializer is None:
+        is_array = hasattr(obj, "dtype") and hasattr(obj, "tobytes")
+        serializer = _serialize_array_ext if is_array else serialize
+        _EXT_SERIALIZERS[type(obj)] = serializer
+    return serializer(obj)
+
+
+def ext_hook(code: int, data: bytes):
+    """Decode MessagePack extension types packed by :func:`serialize_ext`.
+
+    Args:
+        code: Extension type code.
+        data: Payload of the extension type.
+
+    Returns:
+        Read-only NumPy array viewing the payload if the code is
+        :data:`NUMPY_EXT_CODE`, otherwise the extension type unchanged.
+
+    Raises:
+        ImportError: If the payload is an array but NumPy is not installed.
+    """
+    if code != NUMPY_EXT_CODE:
+        return msgpack.ExtType(code, data)
+    import numpy as np  # only required to read arrays packed as such
+
+    dtype_len = data[0]
+    dtype_str = data[1 : 1 + dtype_len].decode("ascii")
+    ndim = data[1 + dtype_len]
+    offset = 2 + dtype_len
+    shape = struct.unpack_from(f"<{ndim}I", data, offset)
+    offset += 4 * ndim
+    return np.frombuffer(data, dtype=dtype_str, offset=offset).reshape(shape)
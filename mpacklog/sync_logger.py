@@ -8,10 +8,12 @@
 
 import os
 import queue
+from typing import Optional
 
 import msgpack
 
-from .serialize import serialize
+from .serialize import serialize, serialize_ext
+from .utils import drop_page_cache
 
 
 class SyncLogger:
@@ -21,14 +23,25 @@ class SyncLogger:
     are synchronous.
     """
 
-    def __init__(self, path):
+    def __init__(self, path, numpy_ext: bool = False):
         """Initialize logger.
 
         Args:
             path: Path to the output log file.
+            numpy_ext: If set, NumPy arrays in messages are packed as raw bytes
+                in MessagePack extension types, rather than as lists of
+                numbers. See :func:`mpacklog.serialize.serialize_ext`.
         """
+        self.__dropped = 0
+        self.__written = 0
+        self.__fd: Optional[int] = None
+        self.__buffer = bytearray()
+        self.__packer = msgpack.Packer(
+            default=serialize_ext if numpy_ext else serialize,
+            use_bin_type=True,
+        )
         self.path = path
-        self.queue = queue.Queue()
+        self.queue: queue.Queue = queue.Queue()
 
         # Check if the file already exists so that SyncLogger.write doesn't
         # append to an existing file
@@ -51,11 +64,52 @@ class SyncLogger:
     def write(self):
         """Write all messages in the queue to the file.
 
-        This method appends to the file if it already exists.
-        """
-        with open(self.path, "ab") as file:
-            packer = msgpack.Packer(default=serialize, use_bin_type=True)
+        This method appends to the file if it already exists. Messages are
+        packed into a single buffer, which is then written to file at once.
+        The file is kept open until :func:`close` is called.
 
+        If a message fails to pack, messages packed before it are still
+        written to file before the exception is raised, while messages after
+        it are left in the queue.
+        """
+        try:
             while not self.queue.empty():
-                message = self.queue.get()
-                file.write(packer.pack(message))
+                self.__buffer += self.__packer.pack(self.queue.get_nowait())
+        finally:  # write messages packed before any packing error
+            self.__write_buffer()
+
+    def __write_buffer(self) -> None:
+        """Write packed messages to file.
+
+        Bytes that could not be written, for instance if ``os.write`` raised,
+        are kept in the buffer for the next call.
+        """
+        if self.__fd is None:
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+            flags |= getattr(os, "O_BINARY", 0)  # no newline translation
+            self.__fd = os.open(self.path, flags, 0o666)  # masked by umask
+        buffer = self.__buffer
+        offset = 0
+        try:
+            with memoryview(buffer) as view:
+                while offset < len(view):  # os.write may write partially
+                    offset += os.write(self.__fd, view[offset:])
+        finally:  # only keep bytes that were not written
+            self.__buffer = buffer[offset:]
+            self.__written += offset
+        self.__dropped = drop_page_cache(
+            self.__fd, self.__written, self.__dropped
+        )
+
+    def close(self):
+        """Close the log file.
+
+        Calling :func:`write` after this reopens the file in append mode.
+        """
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
+
+    def __del__(self):
+        """Close the log file when the logger is deleted."""
+        self.close()
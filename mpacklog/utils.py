@@ -6,9 +6,11 @@
 
 """Utility functions."""
 
-import glob
 import logging
 import os
+import stat
+
+PAGE_CACHE_WINDOW: int = 1 << 20  # bytes
 
 
 def find_log_file(log_path: str) -> str:
@@ -16,15 +18,63 @@ def find_log_file(log_path: str) -> str:
 
     Args:
         log_path: Path to a directory or a specific log file.
+
+    Returns:
+        Path to the log file itself, or to the most recent log file in the
+        directory.
+
+    Raises:
+        FileNotFoundError: If the directory contains no log file.
+
+    Note:
+        Directory entries are scanned in a single pass, using the stat results
+        cached by ``os.scandir`` rather than calling ``getmtime`` on each file.
     """
-    if os.path.exists(log_path):
-        if os.path.isfile(log_path):
-            return log_path
-    mpack_files = glob.glob(os.path.join(log_path, "*.mpack"))
-    log_file = max(mpack_files, key=os.path.getmtime)
+    if os.path.isfile(log_path):
+        return log_path
+    log_file, latest_mtime = None, None
+    with os.scandir(log_path) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".mpack") or not entry.is_file():
+                continue
+            mtime = entry.stat().st_mtime
+            if latest_mtime is None or mtime > latest_mtime:
+                log_file, latest_mtime = entry.path, mtime
+    if log_file is None:
+        raise FileNotFoundError(f"No log file found in {log_path}")
     logging.info(
         "Opening the most recent log in %s: %s",
         log_path,
         os.path.basename(log_file),
     )
     return log_file
+
+
+def drop_page_cache(fd: int, written: int, dropped: int) -> int:
+    """Advise the kernel to drop already-written pages from its page cache.
+
+    Loggers write data that they never read back. This function tells the
+    kernel that pages written before the last :data:`PAGE_CACHE_WINDOW`
+    bytes will not be needed, so that a long-running logger does not evict
+    pages from other processes. It does nothing on platforms without
+    ``posix_fadvise``, or when the descriptor is not a regular file.
+
+    Args:
+        fd: File descriptor of the log file.
+        written: Number of bytes written to the file so far.
+        dropped: Number of bytes advised to drop so far.
+
+    Returns:
+        Updated number of bytes advised to drop.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return dropped
+    if written - dropped < 2 * PAGE_CACHE_WINDOW:
+        return dropped
+    dropped = written - PAGE_CACHE_WINDOW
+    try:
+        if stat.S_ISREG(os.fstat(fd).st_mode):  # not a pipe or FIFO
+            os.posix_fadvise(fd, 0, dropped, os.POSIX_FADV_DONTNEED)
+    except OSError:  # this is only a hint, logging goes on regardless
+        pass
+    return dropped
@@ -11,9 +11,10 @@
 """Data associated with a plot."""
 
 import time
-from typing import List, Optional
+from typing import Optional
 
 import matplotlib
+import numpy as np
 
 from .plot_callback import PlotCallback
 
@@ -21,16 +22,19 @@ from .plot_callback import PlotCallback
 class PlotItem:
     """Data associated with a plot.
 
+    Plot data is stored in preallocated arrays, where new samples are written
+    after the last one. When the end of the arrays is reached, samples in the
+    history window are moved back to the beginning of the arrays, which are
+    reallocated with twice the capacity if more than half-full.
+
     Attributes:
         COLORS: Successive plot colors, as a string of color-code characters.
-        xdata: Matplotlib x-axis data.
-        ydata: Matplotlib y-axis data.
+        INITIAL_CAPACITY: Initial number of samples in plot data arrays.
     """
 
     COLORS = "rbgcmyk"
+    INITIAL_CAPACITY: int = 1024
     line: Optional[matplotlib.lines.Line2D]
-    xdata: List[float]
-    ydata: List[float]
 
     def __init__(self, axis, plot_widget, name, callback: PlotCallback):
         """Initialize plot item.
@@ -46,8 +50,33 @@ class PlotItem:
         self.line = None
         self.name = name
         self.plot_widget = plot_widget
-        self.xdata = []
-        self.ydata = []
+        self.__start = 0
+        self.__end = 0
+        self.__times = np.empty(self.INITIAL_CAPACITY)
+        self.__values = np.empty(self.INITIAL_CAPACITY)
+
+    @property
+    def xdata(self) -> np.ndarray:
+        """Matplotlib x-axis data."""
+        return self.__times[self.__start : self.__end]
+
+    @property
+    def ydata(self) -> np.ndarray:
+        """Matplotlib y-axis data."""
+        return self.__values[self.__start : self.__end]
+
+    def __make_room(self) -> None:
+        """Move samples back to the beginning of data arrays."""
+        size = self.__end - self.__start
+        if 2 * size > len(self.__times):
+            capacity = 2 * len(self.__times)
+            times, values = np.empty(capacity), np.empty(capacity)
+        else:  # enough room after moving samples back
+            times, values = self.__times, self.__values
+        times[:size] = self.xdata
+        values[:size] = self.ydata
+        self.__times, self.__values = times, values
+        self.__start, self.__end = 0, size
 
     def make_line(self) -> matplotlib.lines.Line2D:
         """Add a new line to the plot.
@@ -79,7 +108,7 @@ class PlotItem:
             self.axis.autoscale()
         else:
             self.axis.legend(loc=self.axis.legend_loc)
-        self.plot_widget.canvas.draw()
+        self.plot_widget.canvas.draw_idle()
 
     def handle_update(self, value) -> None:
         """Callback function called when a new value is added to the plot.
@@ -91,22 +120,18 @@ class PlotItem:
             return
 
         line = self.line if self.line is not None else self.make_line()
-        now = time.time()
-        self.xdata.append(now)
-        self.ydata.append(value)
+        now = time.monotonic()
+        if self.__end == len(self.__times):
+            self.__make_room()
+        self.__times[self.__end] = now
+        self.__values[self.__end] = value
+        self.__end += 1
 
         # Remove elements from the beginning until there is at most
         # one before the window.
         oldest_time = now - self.plot_widget.history_duration
-        oldest_index = None
-        for i, xdata_i in enumerate(self.xdata):
-            if xdata_i >= oldest_time:
-                oldest_index = i - 1
-                break
-
-        if oldest_index and oldest_index > 1:
-            self.xdata = self.xdata[oldest_index:]
-            self.ydata = self.ydata[oldest_index:]
+        oldest_index = self.__start + np.searchsorted(self.xdata, oldest_time)
+        self.__start = max(self.__start, int(oldest_index) - 1)
 
         line.set_data(self.xdata, self.ydata)
         self.axis.relim()
@@ -11,6 +11,7 @@
 """Interactively display and update values from an embedded device."""
 
 import time
+from typing import Optional
 
 import matplotlib
 import matplotlib.figure
@@ -22,6 +23,9 @@ from .plot_item import PlotItem
 
 qt_backend = matplotlib.backends.backend_qt5agg
 
+# Minimum duration between two redraw requests to the canvas.
+MIN_DRAW_PERIOD_NS: int = 100_000_000  # nanoseconds
+
 # This value is also written in the XML layout file, in the "value" property of
 # the "historySpin" spinbox. The two values should be kept in sync.
 DEFAULT_HISTORY_DURATION: float = 10.0  # seconds
@@ -36,24 +40,25 @@ class PlotWidget(
         canvas: Canvas to plot figure to.
         figure: Matplotlib figure.
         history_duration: History duration in seconds.
-        last_draw_time: Last time the canvas was redrawn.
+        last_draw_time: Last time the canvas was redrawn, from the monotonic
+            clock in nanoseconds.
         left_axis: Left plot axis.
         next_color: Next plot color to pick.
         pause_action: GUI action for the pause button.
         paused: True if and only if plotting is paused.
-        right_axis: Right plot axis.
+        right_axis: Right plot axis, if any plot is on it.
         toolbar: GUI toolbar with a pause button.
     """
 
     canvas: FigureCanvasQTAgg
     figure: matplotlib.figure.Figure
     history_duration: float
-    last_draw_time: float
+    last_draw_time: int
     left_axis: matplotlib.axes.Axes
     next_color: int
     pause_action: QtWidgets.QAction
     paused: bool
-    right_axis: matplotlib.axes.Axes
+    right_axis: Optional[matplotlib.axes.Axes]
     toolbar: qt_backend.NavigationToolbar2QT
 
     def __init__(self, *args, **kwargs):
@@ -66,7 +71,7 @@ class PlotWidget(
         QtWidgets.QWidget.__init__(self, *args, **kwargs)
 
         self.history_duration = DEFAULT_HISTORY_DURATION
-        self.last_draw_time = 0.0
+        self.last_draw_time = 0
         self.next_color = 0
         self.paused = False
 
@@ -81,6 +86,8 @@ class PlotWidget(
         self.left_axis.fmt_xdata = lambda x: f"{x:.3f}"
         self.left_axis.legend_loc = 3
         self.right_axis = None
+        self.__axes_by_key = {"1": self.left_axis}
+        self.__right_plot_count = 0
 
         self.toolbar = qt_backend.NavigationToolbar2QT(self.canvas, self)
         self.pause_action = QtWidgets.QAction("Pause", self)
@@ -120,32 +127,39 @@ class PlotWidget(
             if self.right_axis is None:
                 self.right_axis = self.left_axis.twinx()
                 self.right_axis.legend_loc = 2
+                self.__axes_by_key["2"] = self.right_axis
             axis = self.right_axis
+            self.__right_plot_count += 1
         item = PlotItem(axis, self, name, callback)
         return item
 
     def remove_plot(self, item: PlotItem) -> None:
         """Remove a plot.
 
+        The right axis is removed along with its last plot, so that the figure
+        is not rendered with an empty axis.
+
         Args:
             item: Plot item corresponding to the plot to remove.
         """
         item.remove()
+        if self.right_axis is not None and item.axis is self.right_axis:
+            self.__right_plot_count -= 1
+            if self.__right_plot_count == 0:
+                self.right_axis.remove()
+                self.right_axis = None
+                del self.__axes_by_key["2"]
 
     def data_update(self) -> None:
-        """Redraw plot after data has been updated."""
-        now = time.time()
-        elapsed = now - self.last_draw_time
-        if elapsed > 0.1:
-            self.last_draw_time = now
-            self.canvas.draw()
+        """Request a redraw of the plot after data has been updated.
 
-    def __get_axes_keys(self):
-        result = []
-        result.append(("1", self.left_axis))
-        if self.right_axis:
-            result.append(("2", self.right_axis))
-        return result
+        The redraw itself happens when control returns to the Qt event loop,
+        so that several updates in between result in a single redraw.
+        """
+        now = time.monotonic_ns()
+        if now - self.last_draw_time > MIN_DRAW_PERIOD_NS:
+            self.last_draw_time = now
+            self.canvas.draw_idle()
 
     def handle_key_press(self, event):
         """Handle a key-press event.
@@ -153,13 +167,10 @@ class PlotWidget(
         Args:
             event: Event to handle.
         """
-        if event.key not in ["1", "2"]:
+        if event.key not in ("1", "2"):
             return
-        for key, axis in self.__get_axes_keys():
-            if key == event.key:
-                axis.set_navigate(True)
-            else:
-                axis.set_navigate(False)
+        for key, axis in self.__axes_by_key.items():
+            axis.set_navigate(key == event.key)
 
     def handle_key_release(self, event):
         """Handle a key-release event.
@@ -167,7 +178,7 @@ class PlotWidget(
         Args:
             event: Event to handle.
         """
-        if event.key not in ["1", "2"]:
+        if event.key not in ("1", "2"):
             return
-        for _, axis in self.__get_axes_keys():
+        for axis in self.__axes_by_key.values():
             axis.set_navigate(True)
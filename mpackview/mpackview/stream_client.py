@@ -12,10 +12,73 @@ from typing import Optional
 
 import msgpack
 
+# Size in bytes of the buffer data from the server is received into.
+READ_SIZE: int = 1 << 16
+
+
+class ReplyProtocol(asyncio.BufferedProtocol):
+    """Protocol unpacking replies from the server as they are received.
+
+    Data from the server is received into a preallocated buffer, rather than
+    into a new bytes object for each read, then fed to the unpacker.
+
+    Attributes:
+        buffer: Preallocated buffer data is received into.
+        replies: Queue of unpacked replies, with None when the connection is
+            lost.
+        unpacker: Unpacker fed with data from the server.
+    """
+
+    buffer: bytearray
+    replies: asyncio.Queue
+    unpacker: msgpack.Unpacker
+
+    def __init__(self, unpacker: msgpack.Unpacker) -> None:
+        """Initialize protocol.
+
+        Args:
+            unpacker: Unpacker to feed with data from the server.
+        """
+        self.buffer = bytearray(READ_SIZE)
+        self.replies = asyncio.Queue()
+        self.unpacker = unpacker
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Get the buffer to receive data into.
+
+        Args:
+            sizehint: Recommended minimum size of the buffer, unused.
+
+        Returns:
+            View of the preallocated buffer.
+        """
+        return memoryview(self.buffer)
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Unpack replies after new data has been received.
+
+        Args:
+            nbytes: Number of bytes received into the buffer.
+        """
+        self.unpacker.feed(memoryview(self.buffer)[:nbytes])
+        for reply in self.unpacker:
+            self.replies.put_nowait(reply)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        """Signal that there will be no more replies.
+
+        Args:
+            exc: Exception that closed the connection, if any.
+        """
+        self.replies.put_nowait(None)
+
 
 class StreamClient:
     """Stream MessagePack data from a log server."""
 
+    protocol: Optional[ReplyProtocol]
+    transport: Optional[asyncio.Transport]
+
     def __init__(self, host: str, port: int) -> None:
         """Connect to a server.
 
@@ -23,35 +86,45 @@ class StreamClient:
             host: Host name or IP address of the server.
             port: Port number to connect to.
         """
-        unpacker = msgpack.Unpacker(raw=False)
+        unpacker = msgpack.Unpacker(raw=False, use_list=False)
         server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        server.setblocking(False)
-        server.settimeout(5.0)
+        server.settimeout(5.0)  # connection timeout, in seconds
         try:
             server.connect((host, port))
         except ConnectionRefusedError as exn:
             raise ConnectionRefusedError(
                 f'could not connect to "{host}" on port {port}'
             ) from exn
+        self.protocol = None
         self.server = server
+        self.transport = None
         self.unpacker = unpacker
 
     def __del__(self):
-        """Close connection to the server."""
+        """Close connection to the server.
+
+        The socket is closed directly rather than through its transport, as
+        the event loop may already be closed at this point.
+        """
         if hasattr(self, "server"):
             self.server.close()
 
     async def read(self) -> Optional[dict]:
-        """Read a dictionary from the streaming server."""
-        loop = asyncio.get_event_loop()
-        request = "get".encode("utf-8")
-        await loop.sock_sendall(self.server, request)
-        reply_dict = None
-        while reply_dict is None:
-            data = await loop.sock_recv(self.server, 4096)
-            if not data:
-                return None
-            self.unpacker.feed(data)
-            for unpacked in self.unpacker:
-                reply_dict = unpacked
-        return reply_dict
+        """Read a dictionary from the streaming server.
+
+        Returns:
+            Dictionary replied by the server, or None if the connection was
+            closed.
+
+        Note:
+            The server replies to each request with exactly one object. The
+            connected socket is attached to an asyncio transport at the first
+            call, as this requires a running event loop.
+        """
+        if self.transport is None or self.protocol is None:
+            loop = asyncio.get_event_loop()
+            self.transport, self.protocol = await loop.create_connection(
+                lambda: ReplyProtocol(self.unpacker), sock=self.server
+            )
+        self.transport.write(b"get")
+        return await self.protocol.replies.get()
@@ -6,6 +6,8 @@
 
 """Utility functions."""
 
+_format_float = float.__format__
+
 
 def format_value(value) -> str:
     """Format incoming values for the Values column.
@@ -15,5 +17,12 @@ def format_value(value) -> str:
 
     Returns:
         Value formatted as a string.
+
+    Note:
+        This function is called for every leaf of the telemetry tree at every
+        frame. Deserialized floats are exactly of type ``float``, which we
+        check by identity, and format by calling ``float.__format__``
+        directly. This skips parsing a format string and dispatching through
+        the ``format`` builtin.
     """
-    return f"{value:.2g}" if isinstance(value, float) else str(value)
+    return _format_float(value, ".2g") if type(value) is float else str(value)
@@ -11,10 +11,22 @@
 """Main application window."""
 
 import asyncio
+import contextlib
 import logging
 import os
-from typing import Any, Tuple, Union
-
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from loop_rate_limiters import AsyncRateLimiter
 from PySide2 import QtUiTools
 from qtpy import QtCore, QtWidgets
 
@@ -24,6 +36,18 @@ from .sized_tree_widget import SizedTreeWidget
 from .stream_client import StreamClient
 from .utils import format_value
 
+# Rate at which data is requested from the server.
+FRAME_RATE: float = 100.0  # Hz
+
+# Period between two requests to the server while plotting is paused.
+PAUSED_PERIOD: float = 0.1  # seconds
+
+# Item data role where the full name of a tree item is stored.
+NAME_ROLE: int = QtCore.Qt.UserRole + 1
+
+# Item data role where the keys leading to a tree item are stored.
+PATH_ROLE: int = QtCore.Qt.UserRole + 2
+
 
 class Window:
     """Main application window.
@@ -31,7 +55,9 @@ class Window:
     Attributes:
         stream_client: Client to read streaming data from.
         tree: Internal tree connecting the GUI tree from the left panel and
-            data streamed from mpacklog.
+            data streamed from mpacklog. Each node holds its GUI tree item at
+            ``"__item__"``, and leaves also hold their index in the lists of
+            leaves at ``"__leaf__"``.
     """
 
     stream_client: StreamClient
@@ -85,6 +111,14 @@ class Window:
         self.ui.historySpin.valueChanged.connect(update_plot_widget)
 
         QtCore.QTimer.singleShot(0, self.handle_startup)
+        self.__branches: List[Tuple[tuple, Union[FrozenSet, int]]] = []
+        self.__leaf_items: List[QtWidgets.QTreeWidgetItem] = []
+        self.__leaf_paths: List[tuple] = []
+        self.__leaf_plots: List[Optional[PlotCallback]] = []
+        self.__leaf_texts: List[str] = []
+        self.__leaf_values: List[Any] = []
+        self.__nodes: Dict[Tuple[str, ...], dict] = {}
+        self.__replies: asyncio.Queue = asyncio.Queue(maxsize=2)
         self.stream_client = stream_client
         self.tree = {}
 
@@ -94,83 +128,238 @@ class Window:
 
     def handle_startup(self):
         """Method called at startup."""
+        asyncio.create_task(self.receive())
         asyncio.create_task(self.run())
 
-    async def run(self):
-        """Main loop of the application."""
-        data = await self.stream_client.read()
-        self.ui.telemetryTreeWidget.clear()
-        self.tree.clear()
-        self.update_tree(self.ui.telemetryTreeWidget, data, self.tree)
+    @contextlib.contextmanager
+    def batch_tree_updates(self) -> Iterator[None]:
+        """Context where the telemetry tree is updated without repainting.
+
+        Updates and signals of the tree widget are disabled within the
+        context, so that the widget is repainted once at the end of the batch
+        rather than once per modified item.
+        """
+        tree_widget = self.ui.telemetryTreeWidget
+        tree_widget.setUpdatesEnabled(False)
+        tree_widget.blockSignals(True)
+        try:
+            yield
+        finally:
+            tree_widget.blockSignals(False)
+            tree_widget.setUpdatesEnabled(True)
+
+    async def receive(self):
+        """Receive data from the stream client in the background.
+
+        Data is requested from the server at :data:`FRAME_RATE`, or at a
+        lower rate while plotting is paused. Replies are pushed to a bounded
+        queue. When the GUI falls behind, the oldest reply is dropped so that
+        only the most recent ones are kept and network reads are never
+        stalled by tree or plot updates.
+        """
+        rate = AsyncRateLimiter(
+            frequency=FRAME_RATE, name="receive", warn=False
+        )
         while True:
             try:
                 data = await self.stream_client.read()
             except ConnectionResetError:
                 data = None
+            if self.__replies.full():
+                self.__replies.get_nowait()
+            self.__replies.put_nowait(data)
+            if data is None:
+                break
+            if self.ui.plotWidget.paused:
+                await asyncio.sleep(PAUSED_PERIOD)
+            else:  # the server replies right away, so we set the pace
+                await rate.sleep()
+
+    async def run(self):
+        """Main loop of the application, updating the GUI from replies."""
+        self.ui.telemetryTreeWidget.clear()
+        self.tree.clear()
+        self.__nodes.clear()
+        while True:
+            data = await self.__replies.get()
             if data is None:
                 logging.warning("Connection reset by peer, plot is now frozen")
                 break
-            try:
-                self.update_data(data, self.tree)
-            except KeyError:  # tree structure has changed
-                self.update_tree(self.ui.telemetryTreeWidget, data, self.tree)
-                self.update_data(data, self.tree)
-            await asyncio.sleep(0.01)
+            with self.batch_tree_updates():
+                if not (
+                    self.has_same_structure(data) and self.update_data(data)
+                ):
+                    self.rebuild_tree(data)
+                    self.update_data(data)
+
+    def rebuild_tree(self, data: dict) -> None:
+        """Update the GUI tree and the lists of its branches and leaves.
+
+        Args:
+            data: Deserialized dictionary to read the tree structure from.
+        """
+        plots = {
+            path: plot
+            for path, plot in zip(self.__leaf_paths, self.__leaf_plots)
+            if plot is not None
+        }
+        self.__branches.clear()
+        self.__leaf_items.clear()
+        self.__leaf_paths.clear()
+        self.__leaf_plots.clear()
+        self.__leaf_texts.clear()
+        self.__leaf_values.clear()
+        for node in self.__nodes.values():  # nodes may no longer be leaves
+            node.pop("__leaf__", None)
+        self.update_tree(
+            self.ui.telemetryTreeWidget.invisibleRootItem(), data, self.tree
+        )
+        for index, path in enumerate(self.__leaf_paths):
+            self.__leaf_plots[index] = plots.get(path)
 
     def update_tree(
         self,
         item: QtWidgets.QTreeWidgetItem,
         data: Union[dict, list, Any],
         node: dict,
+        path: Tuple[Union[str, int], ...] = (),
     ) -> None:
         """Update the tree structure of the GUI left pane.
 
         Args:
             item: Tree widget item from the left GUI panel.
             data: Deserialized object to read the tree structure from. A
-                dictionary or a list yields an internal node in the tree, while
-                a value yields a leaf.
+                dictionary, a tuple or a list yields an internal node in the
+                tree, while a value yields a leaf.
             node: Node in the internal tree.
+            path: Sequence of keys and indices leading to the node from the
+                root of deserialized objects.
         """
         node["__item__"] = item
-        if isinstance(data, dict):
-            keys = sorted(data.keys())
+        data_type = type(data)  # unpacked objects are never subclasses
+        keys: Sequence[str]
+        if data_type is dict:
+            key_set = frozenset(data)
+            sorted_keys = node.get("__keys__")
+            if sorted_keys is None or sorted_keys[0] != key_set:
+                sorted_keys = (key_set, tuple(sorted(key_set)))
+                node["__keys__"] = sorted_keys  # sort only when keys change
+            keys = sorted_keys[1]
             is_dict = True
-        elif isinstance(data, list):
+        elif data_type is tuple or data_type is list:
             keys = [str(i) for i, _ in enumerate(data)]
             is_dict = False
-        else:  # not isinstance(data, (dict, list)):
+        else:  # data is not a dict, tuple or list
+            node["__leaf__"] = len(self.__leaf_items)
+            self.__leaf_items.append(item)
+            self.__leaf_paths.append(path)
+            self.__leaf_plots.append(None)
+            self.__leaf_texts.append(item.text(1))
+            self.__leaf_values.append(object())  # differs from all values
             return
-        for index, key in enumerate(keys):
+        self.__branches.append((path, key_set if is_dict else len(data)))
+        if item.text(1):  # item was a leaf with a value
+            item.setText(1, "")
+        new_children = []
+        parent_name = item.data(0, NAME_ROLE)
+        parent_path = tuple(item.data(0, PATH_ROLE) or ())
+        for key in keys:
             if key not in node:
-                child = QtWidgets.QTreeWidgetItem(item)
+                name = f"{parent_name}.{key}" if parent_name else key
+                node_path = parent_path + (key,)
+                child = QtWidgets.QTreeWidgetItem()
                 child.setText(0, key)
-                node[key] = {}
-            else:  # item is already in the tree
-                child = node[key]["__item__"]
-            value = data[key if is_dict else index]
-            self.update_tree(child, value, node[key])
+                child.setData(0, NAME_ROLE, name)
+                child.setData(0, PATH_ROLE, node_path)
+                new_children.append(child)
+                node[key] = {"__item__": child}
+                self.__nodes[node_path] = node[key]
+        if new_children:  # insert all new children at once
+            item.addChildren(new_children)
+        for index, key in enumerate(keys):
+            data_key = key if is_dict else index
+            self.update_tree(
+                node[key]["__item__"],
+                data[data_key],
+                node[key],
+                path + (data_key,),
+            )
+
+    def has_same_structure(self, data: dict) -> bool:
+        """Check whether data has the same structure as the current tree.
+
+        Branches are checked from the root down, comparing the keys of each
+        dictionary and the length of each tuple or list to those from the last
+        call to :func:`rebuild_tree`.
 
-    def update_data(self, data: Union[dict, list, Any], node: dict) -> None:
+        Args:
+            data: Deserialized dictionary to check.
+
+        Returns:
+            True if and only if data has the same dictionary keys and sequence
+            lengths as the tree. False if the tree has not been built yet.
+        """
+        if not self.__branches:
+            return False
+        for path, keys in self.__branches:
+            value = data
+            for key in path:  # parent branches have been checked already
+                value = value[key]
+            value_type = type(value)
+            if isinstance(keys, int):
+                if value_type is not tuple and value_type is not list:
+                    return False
+                if len(value) != keys:
+                    return False
+            elif value_type is not dict or value.keys() != keys:
+                return False
+        return True
+
+    def update_data(self, data: dict) -> bool:
         """Update data in the tree of the GUI left pane.
 
+        Rather than walking the tree recursively, this function iterates over
+        the flat lists of branches and leaves built by :func:`rebuild_tree`.
+        Leaves are stored as parallel lists of GUI items, key paths, plot
+        callbacks, last displayed texts and last values. Values are only
+        formatted when they differ from the last ones, and texts only set when
+        they differ from the last displayed ones.
+
         Args:
-            data: Data to update the tree with.
-            node: Node corresponding to the data in the tree.
+            data: Deserialized dictionary to update the tree with. It should
+                have the same branches as the tree, as checked by
+                :func:`has_same_structure`.
+
+        Returns:
+            True if the tree was updated, False if a leaf of the tree is a
+            dictionary, tuple or list in data. In the latter case the tree is
+            left unchanged and should be rebuilt.
         """
-        item = node["__item__"]
-        if isinstance(data, dict):
-            for key, value in data.items():
-                self.update_data(value, node[key])
-        elif isinstance(data, list):
-            for index, value in enumerate(data):
-                self.update_data(value, node[str(index)])
-        else:  # data is not a dictionary
-            item.setText(1, format_value(data))
-            if "__plot__" in node:
-                active = node["__plot__"].update(data)
-                if not active:
-                    del node["__plot__"]
+        new_values = []
+        for path in self.__leaf_paths:
+            value = data
+            for key in path:
+                value = value[key]
+            value_type = type(value)
+            if value_type is dict or value_type is tuple or value_type is list:
+                return False  # leaf became a branch
+            new_values.append(value)
+        items = self.__leaf_items
+        plots = self.__leaf_plots
+        texts = self.__leaf_texts
+        values = self.__leaf_values
+        for index, value in enumerate(new_values):
+            last_value = values[index]
+            if value != last_value or type(value) is not type(last_value):
+                values[index] = value
+                text = format_value(value)
+                if texts[index] != text:  # only repaint changed values
+                    items[index].setText(1, text)
+                    texts[index] = text
+            plot = plots[index]
+            if plot is not None and not plot.update(value):
+                plots[index] = None
+        return True
 
     def handle_tree_expanded(
         self,
@@ -181,7 +370,9 @@ class Window:
         Args:
             item: Tree item that was expanded.
         """
-        self.ui.telemetryTreeWidget.resizeColumnToContents(0)
+        QtCore.QTimer.singleShot(
+            0, lambda: self.ui.telemetryTreeWidget.resizeColumnToContents(0)
+        )
         user_data = item.data(0, QtCore.Qt.UserRole)
         if user_data:
             user_data.expand()
@@ -212,18 +403,16 @@ class Window:
             Pair consisting of the corresponding internal-tree node (either a
             dictionary for an internal node, or a value) and its full
             dot-separated name.
+
+        Note:
+            The full name of an item and the keys leading to it are stored in
+            its data when the item is created. The internal-tree node is
+            looked up from its keys, as different items may have the same
+            name, for instance "a.b" for both ``{"a.b": 1}`` and
+            ``{"a": {"b": 2}}``.
         """
-        top = item
-        keys = []
-        while top:
-            keys.append(top.text(0))
-            top = top.parent()
-        keys.reverse()
-        node = self.tree
-        for key in keys:
-            node = node[key]
-        name = ".".join(keys)
-        return node, name
+        path = tuple(item.data(0, PATH_ROLE))  # Qt may convert it to a list
+        return self.__nodes[path], item.data(0, NAME_ROLE)
 
     def handle_telemetry_context_menu(self, pos: QtCore.QPoint) -> None:
         """Display a right-click context menu in the telemetry tree.
@@ -246,8 +435,11 @@ class Window:
         requested = menu.exec_(self.ui.telemetryTreeWidget.mapToGlobal(pos))
         if requested in plot_actions:
             node, name = self.get_node_name_from_item(item)
+            leaf = node.get("__leaf__")
+            if leaf is None:  # item is no longer in the latest data
+                return
             callback = PlotCallback()
-            node["__plot__"] = callback
+            self.__leaf_plots[leaf] = callback
             plot_item = self.ui.plotWidget.add_plot(
                 name,
                 callback,
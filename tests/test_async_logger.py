@@ -6,26 +6,78 @@
 
 """Test the asynchronous logger."""
 
+import asyncio
 import os
 import tempfile
 import unittest
 
-from mpacklog import AsyncLogger
+from mpacklog import AsyncLogger, read_log
+
+try:
+    import msgspec
+
+    class FooSchema(msgspec.Struct):
+        foo: int
+        something: str
+
+except ImportError:
+    msgspec = None
 
 
 class TestAsyncLogger(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
     async def test_put(self):
-        tmp_file = tempfile.mktemp(suffix=".mpack")
+        tmp_file = os.path.join(self.tmp_dir.name, "test.mpack")
         logger = AsyncLogger(tmp_file)
         self.assertTrue(logger.queue.empty())
         await logger.put({"foo": 42, "something": "else"})
         self.assertFalse(logger.queue.empty())
 
+    async def test_put_many(self):
+        tmp_file = os.path.join(self.tmp_dir.name, "test.mpack")
+        logger = AsyncLogger(tmp_file)
+        await logger.put_many({"foo": foo} for foo in range(3))
+        await logger.flush()
+        self.assertEqual(
+            list(read_log(tmp_file)), [{"foo": 0}, {"foo": 1}, {"foo": 2}]
+        )
+
+    async def test_wait_first_write(self):
+        tmp_file = os.path.join(self.tmp_dir.name, "test.mpack")
+        logger = AsyncLogger(tmp_file)
+        await logger.put({"foo": 42})
+        await logger.flush()
+        await asyncio.wait_for(logger.wait_first_write(), timeout=1.0)
+        self.assertTrue(os.path.exists(tmp_file))
+
     async def test_stop_and_write(self):
-        tmp_file = tempfile.mktemp(suffix=".mpack")
+        tmp_file = os.path.join(self.tmp_dir.name, "test.mpack")
         self.assertFalse(os.path.exists(tmp_file))
 
         logger = AsyncLogger(tmp_file)
         await logger.stop()
         await logger.write()
         self.assertTrue(os.path.exists(tmp_file))
+
+    @unittest.skipIf(msgspec is None, "msgspec is not installed")
+    async def test_schema_with_numpy_ext(self):
+        tmp_file = os.path.join(self.tmp_dir.name, "test.mpack")
+        with self.assertRaises(ValueError):
+            AsyncLogger(tmp_file, schema=FooSchema, numpy_ext=True)
+
+    @unittest.skipIf(msgspec is None, "msgspec is not installed")
+    async def test_write_with_schema(self):
+        tmp_file = os.path.join(self.tmp_dir.name, "test.mpack")
+        logger = AsyncLogger(tmp_file, schema=FooSchema)
+        await logger.put(FooSchema(foo=42, something="else"))
+        await logger.flush()
+        self.assertEqual(
+            list(read_log(tmp_file)), [{"foo": 42, "something": "else"}]
+        )
+        self.assertEqual(
+            list(read_log(tmp_file, schema=FooSchema)),
+            [FooSchema(foo=42, something="else")],
+        )
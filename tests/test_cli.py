@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Test the command-line interface."""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from mpacklog import SyncLogger
+from mpacklog.cli.csv_printer import CSVPrinter
+from mpacklog.cli.json_printer import JSONPrinter
+from mpacklog.cli.main import dump_log
+
+
+class TestCLI(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "test.mpack")
+        logger = SyncLogger(self.path, numpy_ext=True)
+        logger.put({"time": 0.5, "x": np.array([1.0, 2.0])}, write=True)
+        logger.close()
+
+    def dump(self, printer_cls, *args) -> str:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            dump_log(self.path, printer_cls(*args))
+        return output.getvalue()
+
+    def test_dump_json_with_numpy_ext(self):
+        output = self.dump(JSONPrinter)
+        self.assertEqual(json.loads(output), {"time": 0.5, "x": [1.0, 2.0]})
+
+    def test_dump_csv_with_numpy_ext(self):
+        output = self.dump(CSVPrinter, ["time", "x"])
+        self.assertEqual(output.splitlines()[1], "0.5,[1.0, 2.0]")
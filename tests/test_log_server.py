@@ -7,6 +7,7 @@
 """Test the server."""
 
 import asyncio
+import os
 import socket
 import tempfile
 import unittest
@@ -15,42 +16,60 @@ import msgpack
 
 from mpacklog import AsyncLogger, LogServer
 
+# Request for the latest logged dictionary.
+GET_REQUEST: bytes = b"get"
+
+
+def get_free_port() -> int:
+    """Get a port number that is free for the server to listen to."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
 
 class TestLogServer(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         await super().asyncSetUp()
+        loop = asyncio.get_running_loop()
+        if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+            loop.set_task_factory(asyncio.eager_task_factory)
 
-        log_file = tempfile.mktemp(suffix=".mpack")
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        log_file = os.path.join(tmp_dir.name, "test.mpack")
         self.logger = AsyncLogger(log_file)
         await self.logger.flush()
-        asyncio.create_task(self.logger.write())
+        self.write_task = loop.create_task(self.logger.write())
 
-        self.server = LogServer(log_file, 4949)
-        asyncio.create_task(self.server.run_async())
-        asyncio.create_task(self.log_ten_foos())
+        self.port = get_free_port()
+        self.server = LogServer(log_file, self.port)
+        self.server_task = loop.create_task(self.server.run_async())
+        self.foo_task = loop.create_task(self.log_ten_foos())
+        self.unpacker = msgpack.Unpacker(raw=False, use_list=False)
 
     async def asyncTearDown(self):
         await self.logger.stop()
         await self.server.stop()
+        tasks = (self.foo_task, self.write_task, self.server_task)
+        for task in tasks:
+            task.cancel()  # no-op on tasks that are already done
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def log_ten_foos(self):
-        for foo in range(10):
-            await self.logger.put({"foo": foo})
-            await asyncio.sleep(0.001)
+        await self.logger.put_many({"foo": foo} for foo in range(10))
 
     async def test_get(self):
-        unpacker = msgpack.Unpacker(raw=False)
-        loop = asyncio.get_event_loop()
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(5.0)
-        sock.connect(("localhost", 4949))
-        sock.setblocking(False)
+        unpacker = self.unpacker
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection("localhost", self.port), timeout=5.0
+        )
 
+        await asyncio.wait_for(self.logger.wait_first_write(), timeout=5.0)
         for trial in range(10):
-            request = "get".encode("utf-8")
-            await loop.sock_sendall(sock, request)
+            writer.write(GET_REQUEST)
+            await writer.drain()
             reply = None
-            data = await loop.sock_recv(sock, 4096)
+            data = await asyncio.wait_for(reader.read(1 << 16), timeout=5.0)
             if not data:
                 return None
             unpacker.feed(data)
@@ -59,7 +78,8 @@ class TestLogServer(unittest.IsolatedAsyncioTestCase):
             if reply:
                 break
 
-        sock.close()
+        writer.close()
+        await writer.wait_closed()
         self.assertTrue("foo" in reply)
         self.assertIsInstance(reply["foo"], int)
         self.assertGreaterEqual(reply["foo"], 0)
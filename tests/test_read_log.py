@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Test reading dictionaries from log files."""
+
+import os
+import tempfile
+import unittest
+
+from mpacklog import SyncLogger, read_log, read_logs
+
+
+class TestReadLog(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write_log(self, name: str, values: range) -> str:
+        path = os.path.join(self.tmp_dir.name, name)
+        logger = SyncLogger(path)
+        for value in values:
+            logger.put({"foo": value})
+        logger.write()
+        return path
+
+    def test_read_log(self):
+        path = self.write_log("foo.mpack", range(5))
+        self.assertEqual([msg["foo"] for msg in read_log(path)], [*range(5)])
+
+    def test_read_logs_in_order(self):
+        paths = [
+            self.write_log(f"log_{i}.mpack", range(10 * i, 10 * i + 10))
+            for i in range(5)
+        ]
+        values = [msg["foo"] for msg in read_logs(paths, workers=2)]
+        self.assertEqual(values, [*range(50)])
+
+    def test_read_logs_small_chunks(self):
+        paths = [
+            self.write_log(f"log_{i}.mpack", range(100 * i, 100 * i + 100))
+            for i in range(3)
+        ]
+        values = [msg["foo"] for msg in read_logs(paths, chunk_size=7)]
+        self.assertEqual(values, [*range(300)])
+
+    def test_read_logs_close_early(self):
+        paths = [
+            self.write_log(f"log_{i}.mpack", range(10 * i, 10 * i + 10))
+            for i in range(5)
+        ]
+        messages = read_logs(paths)
+        self.assertEqual(next(messages), {"foo": 0})
+        messages.close()
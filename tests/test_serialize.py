@@ -8,9 +8,10 @@
 
 import unittest
 
+import msgpack
 import numpy as np
 
-from mpacklog.serialize import serialize
+from mpacklog.serialize import ext_hook, serialize, serialize_ext
 
 
 class FooSerializer:
@@ -27,6 +28,34 @@ class TestSerialize(unittest.TestCase):
     def test_serialize(self):
         foo = FooSerializer()
         x = np.array([1, 2, 3])
-        self.assertEqual(serialize(x), list(x))
-        self.assertEqual(serialize(MockPinocchioSE3(x)), list(x))
+        self.assertEqual(serialize(x), x.tolist())
+        self.assertEqual(serialize(MockPinocchioSE3(x)), x.tolist())
+        self.assertIs(type(serialize(x)[0]), int)
         self.assertEqual(serialize(foo), {"foo": "bar"})
+
+    def test_serialize_numpy_scalar(self):
+        value = serialize(np.float64(1.5))
+        self.assertIsInstance(value, float)
+        self.assertEqual(value, 1.5)
+        self.assertIsInstance(serialize(np.int64(42)), int)
+
+    def test_serialize_cached_type(self):
+        x = np.array([1.0, 2.0])
+        y = np.array([3.0])
+        self.assertEqual(serialize(x), [1.0, 2.0])
+        self.assertEqual(serialize(y), [3.0])
+
+    def test_serialize_ext(self):
+        x = np.arange(6.0).reshape(2, 3)
+        packed = msgpack.packb({"x": x, "y": 1.5}, default=serialize_ext)
+        unpacked = msgpack.unpackb(packed, ext_hook=ext_hook)
+        self.assertEqual(unpacked["x"].dtype, x.dtype)
+        self.assertTrue(np.array_equal(unpacked["x"], x))
+        self.assertEqual(unpacked["y"], 1.5)
+        self.assertEqual(serialize_ext(np.float64(1.5)), 1.5)
+
+    def test_serialize_ext_structured_array(self):
+        x = np.array([(1, 2.0)], dtype=[("a", "i4"), ("b", "f8")])
+        packed = msgpack.packb({"x": x}, default=serialize_ext)
+        unpacked = msgpack.unpackb(packed, ext_hook=ext_hook)
+        self.assertEqual(unpacked["x"], [[1, 2.0]])
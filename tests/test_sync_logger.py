@@ -6,38 +6,136 @@
 
 """Test the synchronous logger."""
 
+import mmap
 import os
+import pathlib
 import tempfile
 import unittest
+from unittest import mock
 
 import msgpack
+import numpy as np
 
-from mpacklog import SyncLogger
+from mpacklog import SyncLogger, read_log
 
 
 class TestSyncLogger(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
     def test_put(self):
-        tmp_file = tempfile.mktemp(suffix=".mpack")
+        tmp_file = os.path.join(self.tmp_dir.name, "test.mpack")
         logger = SyncLogger(tmp_file)
         self.assertTrue(logger.queue.empty())
         logger.put({"foo": 42, "something": "else"})
         self.assertFalse(logger.queue.empty())
 
     def test_write(self):
-        tmp_file = tempfile.mktemp(suffix=".mpack")
+        tmp_file = os.path.join(self.tmp_dir.name, "test.mpack")
         self.assertFalse(os.path.exists(tmp_file))
 
         logger = SyncLogger(tmp_file)
         logger.write()
         self.assertTrue(os.path.exists(tmp_file))
 
+    def test_close_and_write(self):
+        tmp_path = os.path.join(self.tmp_dir.name, "test.mpack")
+
+        logger = SyncLogger(tmp_path)
+        logger.put({"foo": 0}, write=True)
+        logger.close()
+        logger.put({"foo": 1}, write=True)
+        logger.close()
+
+        with open(tmp_path, "rb") as tmp_file:
+            unpacker = msgpack.Unpacker(tmp_file, raw=False)
+            self.assertEqual([msg["foo"] for msg in unpacker], [0, 1])
+
+    def test_write_after_packing_error(self):
+        tmp_path = os.path.join(self.tmp_dir.name, "test.mpack")
+
+        logger = SyncLogger(tmp_path)
+        for message in ({"a": 1}, {"a": 2}, {"bad": object()}, {"a": 4}):
+            logger.put(message)
+        with self.assertRaises(TypeError):
+            logger.write()
+        logger.put({"a": 5}, write=True)
+
+        with open(tmp_path, "rb") as tmp_file:
+            unpacker = msgpack.Unpacker(tmp_file, raw=False)
+            self.assertEqual([msg["a"] for msg in unpacker], [1, 2, 4, 5])
+
+    def test_write_after_os_error(self):
+        tmp_path = os.path.join(self.tmp_dir.name, "test.mpack")
+
+        logger = SyncLogger(tmp_path)
+        logger.put({"a": 1})
+        with mock.patch("os.write", side_effect=OSError):
+            with self.assertRaises(OSError):
+                logger.write()
+        logger.put({"a": 2}, write=True)
+
+        with open(tmp_path, "rb") as tmp_file:
+            unpacker = msgpack.Unpacker(tmp_file, raw=False)
+            self.assertEqual([msg["a"] for msg in unpacker], [1, 2])
+
     def test_write_and_read(self):
-        tmp_path = tempfile.mktemp(suffix=".mpack")
+        tmp_path = os.path.join(self.tmp_dir.name, "test.mpack")
 
         logger = SyncLogger(tmp_path)
         logger.put({"foo": 42, "something": "else"})
         logger.write()
 
+        message = msgpack.unpackb(
+            pathlib.Path(tmp_path).read_bytes(), raw=False, use_list=False
+        )
+        self.assertEqual(message, {"foo": 42, "something": "else"})
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm"), "no /dev/shm")
+    def test_write_large_batch(self):
+        with tempfile.TemporaryDirectory(dir="/dev/shm") as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, "test.mpack")
+            message = {"foo": 42, "something": "else"}
+            nb_messages = 100_000
+
+            logger = SyncLogger(tmp_path)
+            for _ in range(nb_messages):
+                logger.put(message)
+            logger.write()
+
+            self.assertEqual(
+                os.path.getsize(tmp_path),
+                nb_messages * len(msgpack.packb(message)),
+            )
+            with open(tmp_path, "rb") as file, mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as data:
+                unpacker = msgpack.Unpacker(raw=False, use_list=False)
+                unpacker.feed(data)
+                self.assertEqual(sum(1 for _ in unpacker), nb_messages)
+
+    def test_write_several_messages(self):
+        tmp_path = os.path.join(self.tmp_dir.name, "test.mpack")
+
+        logger = SyncLogger(tmp_path)
+        for foo in range(3):
+            logger.put({"foo": foo})
+        logger.write()
+        logger.put({"foo": 3}, write=True)
+
         with open(tmp_path, "rb") as tmp_file:
-            message = msgpack.load(tmp_file)
-            self.assertEqual(message, {"foo": 42, "something": "else"})
+            unpacker = msgpack.Unpacker(tmp_file, raw=False)
+            self.assertEqual([msg["foo"] for msg in unpacker], [0, 1, 2, 3])
+
+    def test_write_numpy_ext(self):
+        tmp_path = os.path.join(self.tmp_dir.name, "test.mpack")
+        x = np.array([[1, 2], [3, 4]], dtype=np.int32)
+
+        logger = SyncLogger(tmp_path, numpy_ext=True)
+        logger.put({"x": x})
+        logger.write()
+
+        message = next(read_log(tmp_path))
+        self.assertEqual(message["x"].shape, (2, 2))
+        self.assertTrue(np.array_equal(message["x"], x))
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Test utility functions."""
+
+import os
+import tempfile
+import unittest
+
+from mpacklog.utils import PAGE_CACHE_WINDOW, drop_page_cache, find_log_file
+
+
+class TestUtils(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def touch(self, name: str, mtime: float) -> str:
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "wb"):
+            pass
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_find_log_file_from_file(self):
+        path = self.touch("foo.mpack", 1.0)
+        self.assertEqual(find_log_file(path), path)
+
+    def test_find_most_recent_log_file(self):
+        self.touch("old.mpack", 1.0)
+        recent = self.touch("recent.mpack", 3.0)
+        self.touch("middle.mpack", 2.0)
+        self.touch("not_a_log.json", 4.0)
+        self.assertEqual(find_log_file(self.tmp_dir.name), recent)
+
+    def test_find_log_file_in_empty_directory(self):
+        with self.assertRaises(FileNotFoundError):
+            find_log_file(self.tmp_dir.name)
+
+    @unittest.skipUnless(hasattr(os, "posix_fadvise"), "needs posix_fadvise")
+    def test_drop_page_cache(self):
+        path = self.touch("foo.mpack", 1.0)
+        with open(path, "wb") as file:
+            fd = file.fileno()
+            self.assertEqual(drop_page_cache(fd, PAGE_CACHE_WINDOW, 0), 0)
+            written = 3 * PAGE_CACHE_WINDOW
+            dropped = drop_page_cache(fd, written, 0)
+            self.assertEqual(dropped, written - PAGE_CACHE_WINDOW)
+
+    @unittest.skipUnless(hasattr(os, "posix_fadvise"), "needs posix_fadvise")
+    def test_drop_page_cache_on_pipe(self):
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        written = 3 * PAGE_CACHE_WINDOW
+        dropped = drop_page_cache(write_fd, written, 0)
+        self.assertEqual(dropped, written - PAGE_CACHE_WINDOW)